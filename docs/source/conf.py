@@ -12,7 +12,7 @@ import pathlib
 import shutil
 import sys
 
-import pkg_resources
+from importlib.metadata import metadata
 
 
 # a couple of folders
@@ -24,22 +24,35 @@ moduledir = srcdir.joinpath('mmeson')
 # add folder with module source to sys.path
 sys.path.insert(0, srcdir.as_posix())
 
+
+def copy_if_newer(src: str, dst: str) -> None:
+    """
+    Copies a file only if the destination does not exist yet or is older than the source. This avoids touching the
+    copied files on every build, which would invalidate sphinx's incremental build.
+    """
+    dst_path = pathlib.Path(dst)
+    if dst_path.is_dir():
+        dst_path = dst_path.joinpath(pathlib.Path(src).name)
+    if not dst_path.exists() or pathlib.Path(src).stat().st_mtime > dst_path.stat().st_mtime:
+        shutil.copy(src, dst_path)
+
+
 # copy README and screenshots
-shutil.copy(repodir.joinpath('README.md'), docssrcdir)
-shutil.copytree(repodir.joinpath('screenshots'), docssrcdir.joinpath('screenshots'), dirs_exist_ok=True)
+copy_if_newer(repodir.joinpath('README.md'), docssrcdir)
+shutil.copytree(repodir.joinpath('screenshots'), docssrcdir.joinpath('screenshots'), dirs_exist_ok=True,
+                copy_function=copy_if_newer)
 
 # project metadata
-distribution = pkg_resources.get_distribution('mmeson')
-project = distribution.project_name
+distribution = metadata('mmeson')
+project = distribution['Name']
 project_copyright = '2022 Stephan Lachnit, CC-BY-SA-4.0'
 author = 'Stephan Lachnit'
-version = distribution.version
-release = distribution.version
+version = distribution['Version']
+release = distribution['Version']
 
 # extensions
 extensions = [
     'myst_parser',
-    'sphinx.ext.autosectionlabel',
     'sphinx.ext.autodoc',
     'sphinx.ext.napoleon',
     'sphinx.ext.intersphinx',
@@ -56,9 +69,6 @@ source_suffix = {
 # HTML settings
 html_theme = 'sphinx_rtd_theme'
 
-# sphinx.ext.autosectionlabel settings
-autosectionlabel_prefix_document = True
-
 # sphinx.ext.autodoc settings
 autodoc_default_options = {
     'members': True,
@@ -5,10 +5,10 @@
 mmeson is a ccmake clone for Meson projects.
 """
 
-import pkg_resources
+from importlib.metadata import version, PackageNotFoundError
 
 __version__ = 'version-unknown'
 try:
-    __version__ = pkg_resources.get_distribution(__name__).version
-except pkg_resources.DistributionNotFound:
+    __version__ = version(__name__)
+except PackageNotFoundError:
     pass  # running from source folder without installation, run "make" or "setup.py egg_info" to create distribution
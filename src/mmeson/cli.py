@@ -12,7 +12,6 @@ import sys
 from . import __version__
 from .meson_interface import MesonManager
 from .options import OptionsManager
-from .tui import build_ui, main_loop
 
 
 def parse_args(args: list[str]) -> argparse.Namespace:
@@ -51,12 +50,16 @@ def main(args: list[str] = None) -> int:
     meson_manager.set_builddir(cli_options.builddir)
     meson_manager.set_meson_bin(cli_options.bin)
 
+    # import urwid only after the arguments and the builddir are validated
+    # pylint: disable=import-outside-toplevel
+    from .tui import build_ui, main_loop
+
     options_manager = OptionsManager()
     options_manager.set_options(meson_manager.parse_buildoptions())
-    meson_version = meson_manager.parse_meson_version()
+    meson_version, _ = meson_manager.parse_meson_info()
     project_name, project_version = meson_manager.parse_projectinfo()
 
     tlw = build_ui(project_name, project_version, meson_version)
-    return_code = main_loop(tlw)
+    return_code = main_loop(tlw, meson_manager)
 
     return return_code
@@ -6,12 +6,22 @@ Module containing Meson-related classes and funtions.
 """
 
 import enum
-import json
+import os
 import pathlib
-import subprocess
+import sys
+
+try:
+    import orjson as json
+except ImportError:
+    import json
 
 from .options import Option, OptionsManager, MesonType, MesonSection, MesonMachine
-from .singleton import Singleton
+
+
+# value to member lookups, avoids going through EnumMeta.__call__ for every parsed option
+_MESON_TYPES = {member.value: member for member in MesonType}
+_MESON_SECTIONS = {member.value: member for member in MesonSection}
+_MESON_MACHINES = {member.value: member for member in MesonMachine}
 
 
 class ExitAction(enum.Enum):
@@ -26,22 +36,26 @@ class ExitAction(enum.Enum):
     """Exit without saving the changed config values."""
 
     RECONFIGURE = 'reconfigure'
-    """Same as :attr:`ONLY_CONFIGURE` but calls ``meson setup --reconfigure`` afterwards."""
+    """Same as :attr:`ONLY_CONFIGURE` but uses ``meson setup --reconfigure`` to also reconfigure the project."""
 
 
-class MesonManager(metaclass=Singleton):
+class MesonManager():
     """
-    Singleton class managing Meson-related parsing and actions.
+    Class managing Meson-related parsing and actions.
 
     Attributes:
         builddir: :class:`pathlib.Path` containing the builddir (has to be set via :func:`set_builddir()`).
         meson_bin: :obj:`str` pointing to the Meson binary (has to be set via :func:`set_meson_bin()`).
+        workdir: :class:`pathlib.Path` containing the source folder (has to be set via :func:`parse_meson_info()`).
         exit_action: see :class:`ExitAction` for details.
     """
     def __init__(self) -> None:
         self.builddir = pathlib.Path()
+        self._info_dir = pathlib.Path('meson-info')
         self.meson_bin = str()
+        self.workdir = pathlib.Path()
         self.exit_action = ExitAction.NOTHING
+        self._intro_cache: dict[str, dict] = {}
 
     def set_builddir(self, builddir: pathlib.Path):
         """
@@ -51,6 +65,8 @@ class MesonManager(metaclass=Singleton):
             builddir: :class:`pathlib.Path` pointing to the builddir.
         """
         self.builddir = builddir
+        self._info_dir = builddir.joinpath('meson-info')
+        self._intro_cache.clear()
         if not self.builddir.is_dir():
             raise Exception(f'{self.builddir.as_posix()} is not a directory')
 
@@ -63,21 +79,36 @@ class MesonManager(metaclass=Singleton):
         """
         self.meson_bin = meson_bin
 
-    def get_intro_file(self, intro_file: str) -> dict:
+    def get_intro_file(self, intro_file: str, cache: bool = True) -> dict:
         """
-        Loads and introspection file from the ``meson-info`` folder and parses the json into a :obj:`dict`.
+        Loads and introspection file from the ``meson-info`` folder and parses the json into a :obj:`dict`. The parsed
+        result is cached, so every introspection file is only read once.
 
         Args:
             intro_file: Name of the introspection file.
+            cache: If :obj:`False`, the parsed result is not stored in the cache. Useful for big files that are only
+                   needed once, such that the parsed objects can be freed after use.
 
         Returns:
             The dict contained in the introspection file.
         """
-        intro_file_path = pathlib.Path(self.builddir, 'meson-info', intro_file)
-        if not intro_file_path.exists():
-            raise FileNotFoundError(f'File {intro_file_path.as_posix()} does not exist')
-        with open(intro_file_path, mode='rt', encoding='utf-8') as file_io:
-            return json.loads(file_io.read())
+        cached = self._intro_cache.get(intro_file)
+        if cached is not None:
+            return cached
+        intro_file_path = self._info_dir.joinpath(intro_file)
+        try:
+            fd = os.open(intro_file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f'File {intro_file_path.as_posix()} does not exist') from error
+        try:
+            # read raw bytes in one go, json.loads (or orjson.loads if available) handles the UTF-8 decoding itself
+            data = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        intro_dict = json.loads(data)
+        if cache:
+            self._intro_cache[intro_file] = intro_dict
+        return intro_dict
 
     def parse_buildoptions(self) -> list[Option]:
         """
@@ -86,18 +117,14 @@ class MesonManager(metaclass=Singleton):
         Returns:
             List of :class:`~.options.Option` parsed from the builddir.
         """
-        intro_dict = self.get_intro_file('intro-buildoptions.json')
-        options = list[Option]()
-        for entry in intro_dict:
-            name = entry['name']
-            value = entry['value']
-            value_type = MesonType(entry['type'])
-            description = entry['description'] if 'description' in entry else None
-            choices = entry['choices'] if 'choices' in entry else None
-            section = MesonSection(entry['section'])
-            machine = MesonMachine(entry['machine'])
-            options.append(Option(name, value, value_type, description, choices, section, machine))
-        return options
+        # the raw entries are only needed to create the options, don't keep them alive in the cache
+        # option names are interned since they are used as sort keys and displayed in the TUI
+        intro_dict = self.get_intro_file('intro-buildoptions.json', cache=False)
+        return [
+            Option(sys.intern(entry['name']), entry['value'], _MESON_TYPES[entry['type']], entry.get('description'),
+                   entry.get('choices'), _MESON_SECTIONS[entry['section']], _MESON_MACHINES[entry['machine']])
+            for entry in intro_dict
+        ]
 
     def parse_projectinfo(self) -> tuple[str, str]:
         """
@@ -111,25 +138,18 @@ class MesonManager(metaclass=Singleton):
         project_version = intro_dict['version']
         return (project_name, project_version)
 
-    def parse_meson_version(self) -> str:
+    def parse_meson_info(self) -> tuple[str, pathlib.Path]:
         """
-        Parses the meson version given by Meson in the builddir.
+        Parses the meson version and the source folder given by Meson in the builddir. The source folder is also stored
+        in :attr:`workdir`.
 
         Returns:
-            String containing the used meson version.
+            Tuple containing the used meson version as string and the :class:`pathlib.Path` to the source folder.
         """
         intro_dict = self.get_intro_file('meson-info.json')
-        return intro_dict['meson_version']['full']
-
-    def parse_meson_workdir(self) -> pathlib.Path:
-        """
-        Parses the meson source folder given by Meson in the builddir.
-
-        Returns:
-            :class:`pathlib.Path` containing path to the source folder.
-        """
-        intro_dict = self.get_intro_file('meson-info.json')
-        return pathlib.Path(intro_dict['directories']['source'])
+        meson_version = intro_dict['meson_version']['full']
+        self.workdir = pathlib.Path(intro_dict['directories']['source'])
+        return (meson_version, self.workdir)
 
     def set_exit_action(self, exit_action: ExitAction) -> None:
         """
@@ -140,14 +160,16 @@ class MesonManager(metaclass=Singleton):
         """
         self.exit_action = exit_action
 
-    def run_exit_action(self) -> int:
+    def run_exit_action(self, options_manager: OptionsManager) -> int:
         """
         Runs the exit action. For exact behaviour see :class:`ExitAction` for details.
 
+        Args:
+            options_manager: :class:`~.OptionsManager` containing the modified options.
+
         Returns:
             Return code from the last Meson call or ``0`` if Meson is never called.
         """
-        options_manager = OptionsManager()
         modified_options = options_manager.get_modified_options()
         modified_options_count = len(modified_options)
 
@@ -160,23 +182,19 @@ class MesonManager(metaclass=Singleton):
             print('Nothing to configure!')
             return 0
 
-        print(f'Configuring {modified_options_count} changes')
-        config_args = list[str]()
-        for option in modified_options:
-            config_args.append(f'-D{option.name}={option.value_as_string()}')
+        # only needed here, avoid the import cost when exiting without configuring
+        # pylint: disable=import-outside-toplevel
+        import subprocess
 
-        cwd = self.parse_meson_workdir()
-        meson_configure_args = [self.meson_bin, 'configure', self.builddir.as_posix()] + config_args
-        meson_configure_proc = subprocess.run(meson_configure_args, cwd=cwd, check=False)
+        print(f'Configuring {modified_options_count} changes')
+        config_args = [f'-D{option.name}={option.value_as_string()}' for option in modified_options]
 
+        cwd = self.workdir
         if self.exit_action == ExitAction.ONLY_CONFIGURE:
-            return meson_configure_proc.returncode
-
-        if meson_configure_proc.returncode != 0:
-            print('Configuration failed, skipping reconfiguration!')
-            return meson_configure_proc.returncode
-
-        print('Reconfiguring project')
-        meson_reconfigure_args = [self.meson_bin, 'setup', '--reconfigure', self.builddir.as_posix()]
-        meson_reconfigure_proc = subprocess.run(meson_reconfigure_args, cwd=cwd, check=False)
-        return meson_reconfigure_proc.returncode
+            meson_args = [self.meson_bin, 'configure', self.builddir.as_posix(), *config_args]
+        else:
+            # meson setup --reconfigure accepts the options directly, no need to call meson configure first
+            print('Reconfiguring project')
+            meson_args = [self.meson_bin, 'setup', '--reconfigure', self.builddir.as_posix(), *config_args]
+        meson_proc = subprocess.run(meson_args, cwd=cwd, check=False)
+        return meson_proc.returncode
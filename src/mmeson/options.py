@@ -49,6 +49,29 @@ class MesonMachine(enum.Enum):
     BUILD = 'build'
 
 
+_SECTION_ORDER = {
+    MesonSection.USER: 1,
+    MesonSection.BASE: 2,
+    MesonSection.COMPILER: 3,
+    MesonSection.CORE: 4,
+    MesonSection.DIRECTORY: 5,
+    MesonSection.TEST: 6,
+    MesonSection.BACKEND: 7,
+}
+"""Custom ordering of the :class:`MesonSection` used for sorting options in :func:`OptionsManager.set_options()`."""
+
+
+_VALUE_FORMATTERS = {
+    MesonType.STRING: lambda value: f'"{value}"',
+    MesonType.BOOLEAN: lambda value: 'true' if value else 'false',
+    MesonType.COMBO: lambda value: value,
+    MesonType.INTEGER: str,
+    MesonType.ARRAY: lambda value: '[' + ','.join(f'\'{entry}\'' for entry in value) + ']',
+}
+"""Functions formatting an option value of a given :class:`MesonType` for Meson's CLI, see
+:func:`Option.value_as_string()`."""
+
+
 # pylint: disable=too-many-instance-attributes,too-many-arguments,too-few-public-methods
 class Option():
     """
@@ -56,6 +79,8 @@ class Option():
 
     .. __: https://mesonbuild.com/Build-options.html
     """
+    __slots__ = ('name', 'value', 'type', 'description', 'choices', 'section', 'machine', 'modified')
+
     def __init__(self,
                  name: str, value, value_type: MesonType, description: str, choices: list[str],
                  section: MesonSection, machine: MesonMachine):
@@ -68,7 +93,6 @@ class Option():
         self.machine = machine
         self.modified = False
 
-    # pylint: disable=inconsistent-return-statements
     def value_as_string(self) -> str:
         """
         Converts the option value to a string such that it can be used to be passed to Meson's CLI.
@@ -76,20 +100,7 @@ class Option():
         Returns:
             Option value formatted as string.
         """
-        if self.type == MesonType.STRING:
-            return f'"{self.value}"'
-        if self.type == MesonType.BOOLEAN:
-            return repr(self.value).lower()
-        if self.type == MesonType.COMBO:
-            return self.value
-        if self.type == MesonType.INTEGER:
-            return str(self.value)
-        if self.type == MesonType.ARRAY:
-            ret = '['
-            for entry in self.value:
-                ret += f'\'{entry}\','
-            ret = ret[:-1] + ']'
-            return ret
+        return _VALUE_FORMATTERS[self.type](self.value)
 
 
 class OptionsManager(metaclass=Singleton):
@@ -98,9 +109,11 @@ class OptionsManager(metaclass=Singleton):
 
     Attributes:
         options: :obj:`list` of :class:`Option` list of all current options.
+        modified_indices: :obj:`set` of :obj:`int` containing the indices of all modified options.
     """
     def __init__(self):
         self.options = list[Option]()
+        self.modified_indices = set[int]()
 
     def set_options(self, options: list[Option]) -> None:
         """
@@ -114,20 +127,12 @@ class OptionsManager(metaclass=Singleton):
             Sorting with highest priority to subproject name, then the section with a custom ordering and only then the
             name of the option.
             """
-            section_map = {
-                MesonSection.USER: 1,
-                MesonSection.BASE: 2,
-                MesonSection.COMPILER: 3,
-                MesonSection.CORE: 4,
-                MesonSection.DIRECTORY: 5,
-                MesonSection.TEST: 6,
-                MesonSection.BACKEND: 7,
-            }
-            splitted = option.name.split(':')
-            subproject = '' if len(splitted) == 1 else splitted[0]
-            option_name = splitted[0] if len(splitted) == 1 else splitted[1]
-            return (subproject, section_map[option.section], option_name)
+            subproject, separator, option_name = option.name.partition(':')
+            if not separator:
+                subproject, option_name = '', subproject
+            return (subproject, _SECTION_ORDER[option.section], option_name)
         self.options = sorted(options, key=sorter)
+        self.modified_indices = {index for index, option in enumerate(self.options) if option.modified}
 
     def get_options(self) -> list[Option]:
         """
@@ -151,7 +156,7 @@ class OptionsManager(metaclass=Singleton):
         Returns:
             List of all modified options.
         """
-        return list(filter(lambda option: option.modified, self.options))
+        return [self.options[index] for index in sorted(self.modified_indices)]
 
     def set_modified(self, index: int, value) -> None:
         """
@@ -161,5 +166,7 @@ class OptionsManager(metaclass=Singleton):
             index: index of the option in the :attr:`options` list.
             value: value to set according to the option's :class:`MesonType`.
         """
-        self.options[index].modified = True
-        self.options[index].value = value
+        option = self.options[index]
+        option.modified = True
+        option.value = value
+        self.modified_indices.add(index)
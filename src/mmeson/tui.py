@@ -8,18 +8,23 @@ If you are unfamilir with urwid, take a look at the excellent documentation at h
 
 The basic design consits of a :class:`urwid.Frame` with :class:`Header` as header and :class:`Footer` as footer. The
 body consits of :class:`OptionList`, which is a :class:`urwid.ListBox` containing the :class:`OptionRow` widgets. The
-:class:`urwid.ListBox` widget requires a :class:`urwid.SimpleFocusListWalker`, which emits a ``modified`` signal when
-the focused :class:`OptionRow` changes. This is used to update the information in the :class:`Footer`.
+:class:`urwid.ListBox` widget requires a :class:`urwid.ListWalker`, for which :class:`OptionListWalker` is used. It
+creates the :class:`OptionRow` widgets only when they are first displayed and emits a ``modified`` signal when the
+focused :class:`OptionRow` changes. This is used to update the information in the :class:`Footer`.
 
 The :class:`OptionRow` is a :class:`urwid.Columns` with a :class:`urwid.Text` showing the option name on the left and
-a custom :class:`MesonEdit` widget on the to change the option value.
+a custom :class:`MesonEdit` or :class:`MesonIcon` widget on the to change the option value.
 
 Currently, the :class:`MesonEdit` class is a subclass of :class:`urwid.AttrMap` to force the colored output, but this
 is a just an ugly workaround, in theory using TextMarkup (http://urwid.org/manual/displayattributes.html#text-markup)
-should suffice.
+should suffice. This is already done for :class:`MesonIcon`, which is used for the values that are selected instead of
+typed.
 """
 
 from ast import literal_eval
+import collections
+import functools
+import json
 
 import urwid
 
@@ -27,7 +32,7 @@ from .meson_interface import MesonManager, ExitAction
 from .options import Option, OptionsManager, MesonType
 
 
-PALETTE = [
+PALETTE = (
     ('true', 'dark green', ''),
     ('false', 'dark red', ''),
     ('choice', 'light blue', ''),
@@ -36,7 +41,7 @@ PALETTE = [
     ('string', 'yellow', ''),
     ('integer', 'light magenta', ''),
     ('array', 'brown', ''),
-]
+)
 """Color Palette, see `urwid's manual`__ for details.
 
 .. __: http://urwid.org/manual/displaymodules.html#setting-a-palette"""
@@ -77,6 +82,39 @@ class MesonEdit(urwid.AttrMap):
         return None
 
 
+class MesonIcon(urwid.WidgetWrap):
+    """
+    Virtual widget class for option values that are selected instead of typed. Wraps a :class:`urwid.SelectableIcon`
+    that is colored via text markup, such that unlike :class:`MesonEdit` no :class:`urwid.AttrMap` is needed.
+
+    Args:
+        text: Initial text of the icon.
+        color_name: Initial text color from :obj:`PALETTE` as :obj:`str`.
+    """
+
+    signals = ['changed']
+    """:obj:`list` of :mod:`urwid` signal names the class can emit."""
+
+    def __init__(self, text: str, color_name: str):
+        super().__init__(urwid.SelectableIcon((color_name, text)))
+
+    def set_icon(self, text: str, color_name: str) -> None:
+        """
+        Changes the text and the color of the icon.
+
+        Args:
+            text: New text of the icon.
+            color_name: New text color from :obj:`PALETTE` as :obj:`str`.
+        """
+        self._w.set_text((color_name, text))
+
+    def get_value(self):
+        """
+        Virtual function to return the value contained in the widget.
+        """
+        return None
+
+
 class StringEdit(MesonEdit):
     """
     :class:`MesonEdit` widget to modify :class:`~.Option` of type :attr:`~.MesonType.STRING`.
@@ -116,23 +154,22 @@ class StringEdit(MesonEdit):
             size: unused (given from :mod:`urwid`).
             key: key name (given from :mod:`urwid`).
         """
+        edit = self.original_widget
         if key == 'enter':
             self.activated = not self.activated
-            edit_pos = len(self.original_widget.get_text()[0]) if self.activated else 0
-            self.original_widget.set_edit_pos(edit_pos)
+            edit.set_edit_pos(len(edit.edit_text) if self.activated else 0)
             if not self.activated:
                 urwid.emit_signal(self, 'changed')
         else:
             if self.activated:
-                self.original_widget.keypress(size, key)
+                edit.keypress(size, key)
             else:
                 return key
 
 
-class BooleanEdit(MesonEdit):
+class BooleanEdit(MesonIcon):
     """
-    :class:`MesonEdit` widget to modify :class:`~.Option` of type :attr:`~.MesonType.BOOLEAN`.
-    Uses :class:`urwid.SelectableIcon` as base.
+    :class:`MesonIcon` widget to modify :class:`~.Option` of type :attr:`~.MesonType.BOOLEAN`.
 
     Args:
         init_state: value for the initial value of :attr:`state`.
@@ -140,14 +177,20 @@ class BooleanEdit(MesonEdit):
     Attributes:
         state: :obj:`bool` of the current value.
     """
+
+    state_texts = {True: 'True', False: 'False'}
+    """:obj:`dict` mapping the state to the displayed text."""
+
+    state_colors = {True: 'true', False: 'false'}
+    """:obj:`dict` mapping the state to the color name in :obj:`PALETTE`."""
+
     def __init__(self, init_state: bool):
         self.state = init_state
-        widget = urwid.SelectableIcon(repr(init_state))
-        super().__init__(widget, self.attr_map_from_str(repr(init_state).lower()))
+        super().__init__(self.state_texts[init_state], self.state_colors[init_state])
 
     def set_state(self, state: bool) -> None:
         """
-        Set a new state, change color of the :class:`urwid.AttrMap` and emit a ``changed`` signal.
+        Set a new state, change text and color of the icon and emit a ``changed`` signal.
 
         Args:
             state: :obj:`bool` of the new state.
@@ -155,8 +198,7 @@ class BooleanEdit(MesonEdit):
         if self.state == state:
             return
         self.state = state
-        self.original_widget.set_text(repr(state))
-        self.set_attr_map(self.attr_map_from_str(repr(state).lower()))
+        self.set_icon(self.state_texts[state], self.state_colors[state])
         urwid.emit_signal(self, 'changed')
 
     def get_value(self) -> bool:
@@ -186,10 +228,9 @@ class BooleanEdit(MesonEdit):
         self.toggle_state()
 
 
-class ComboEdit(MesonEdit):
+class ComboEdit(MesonIcon):
     """
-    :class:`MesonEdit` widget to modify :class:`~.Option` of type :attr:`~.MesonType.COMBO`.
-    Uses :class:`urwid.SelectableIcon` as base.
+    :class:`MesonIcon` widget to modify :class:`~.Option` of type :attr:`~.MesonType.COMBO`.
 
     Args:
         init_choice: Value used for the initial value of :attr:`choice_index`.
@@ -199,31 +240,31 @@ class ComboEdit(MesonEdit):
         choice_index: :obj:`int` refering to the index of the currently selected choice.
         choices: List of valid choices.
     """
+
+    special_choices = frozenset(('enabled', 'true', 'disabled', 'false'))
+    """Choices that have their own color in :obj:`PALETTE`."""
+
     def __init__(self, init_choice: str, choices: list[str]):
         self.choice_index = choices.index(init_choice)
         self.choices = choices
-        widget = urwid.SelectableIcon(init_choice)
-        super().__init__(widget, self.create_attr_map(init_choice))
+        super().__init__(init_choice, self.get_color_name(init_choice))
 
-    def create_attr_map(self, choice: str) -> dict:
+    def get_color_name(self, choice: str) -> str:
         """
-        Creates an attribute map for the widget. Workaround to adjust the color of the widget depending on the choice.
-        For ``enabled``, ``true``, ``disabled`` and ``false`` the color is defined in :obj:`PALETTE`, for other choices
-        use the ``choice`` color defined in :obj:`PALETTE`.
+        Returns the color of the widget depending on the choice. For ``enabled``, ``true``, ``disabled`` and ``false``
+        the color is defined in :obj:`PALETTE`, for other choices use the ``choice`` color defined in :obj:`PALETTE`.
 
         Args:
-            choice: choice to return color / attribute :obj:`dict` for.
+            choice: choice to return the color name for.
 
         Returns:
-            :obj:`dict` formatted as ``{None: 'color_name'}``.
+            Color name from :obj:`PALETTE` as :obj:`str`.
         """
-        if choice in ['enabled', 'true', 'disabled', 'false']:
-            return self.attr_map_from_str(choice)
-        return self.attr_map_from_str('choice')
+        return choice if choice in self.special_choices else 'choice'
 
     def set_choice(self, choice_index: int) -> None:
         """
-        Set a new choice, change color of the :class:`urwid.AttrMap` and emit a ``changed`` signal.
+        Set a new choice, change text and color of the icon and emit a ``changed`` signal.
 
         Args:
             choice_index: :obj:`int` new choice index for :attr:`choice_index`.
@@ -232,8 +273,7 @@ class ComboEdit(MesonEdit):
             return
         self.choice_index = choice_index
         choice = self.get_choice()
-        self.original_widget.set_text(choice)
-        self.set_attr_map(self.create_attr_map(choice))
+        self.set_icon(choice, self.get_color_name(choice))
         urwid.emit_signal(self, 'changed')
 
     def get_choice(self) -> str:
@@ -317,57 +357,67 @@ class ArrayEdit(StringEdit):
         value: Initial value of the widget.
     """
     def __init__(self, value: list[str]):
-        super().__init__(str(value), 'array')
+        super().__init__(json.dumps(value, ensure_ascii=False), 'array')
 
     # IDEA: custom widget to only edit single array entries
     # `e` to add array entry, `d` to delete entry, `tab` to cycle between entries, `enter` to edit single entry
 
     def get_value(self) -> list[str]:
         """
+        The value is parsed as JSON, if that fails it is parsed as Python literal (e.g. for single-quoted strings).
+
         Returns:
             Value of the widget as :obj:`list` of :obj:`str`.
         """
-        return literal_eval(super().get_value())
+        text = super().get_value()
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return literal_eval(text)
+
+
+_VALUE_WIDGET_BUILDERS = {
+    MesonType.STRING: lambda option: StringEdit(option.value),
+    MesonType.BOOLEAN: lambda option: BooleanEdit(option.value),
+    MesonType.COMBO: lambda option: ComboEdit(option.value, option.choices),
+    MesonType.INTEGER: lambda option: IntegerEdit(option.value),
+    MesonType.ARRAY: lambda option: ArrayEdit(option.value),
+}
+""":obj:`dict` mapping every :class:`~.MesonType` to a function building the corresponding value widget."""
 
 
 class OptionRow(urwid.Columns):
     """
     Widget for a single row in the :class:`OptionList`, consiting of a `urwid.Text` widget on the left (40% width) and
-    a :class:`MesonEdit` widget on the right (60% width).
+    a :class:`MesonEdit` or :class:`MesonIcon` widget on the right (60% width).
 
     Args:
         option: :class:`~.Option` to build the widget for.
 
     Attributes:
-        changed: :obj:`bool` that will be set to :obj:`True` in :func:`set_changed()`.
+        changed: :obj:`bool` that will be set to :obj:`True` in :func:`set_changed()`. Initially :obj:`True` if the
+                 option is already modified, e.g. when the row is recreated by the :class:`OptionListWalker`.
+        name: :obj:`str` containing the option name.
         name_widget: :class:`urwid.Text` containing the option name on the left.
-        value_widget: :class:`MesonEdit` for changing the option value on the right.
+        value_widget: :class:`MesonEdit` or :class:`MesonIcon` for changing the option value on the right.
     """
     def __init__(self, option: Option):
-        self.changed = False
-        self.name_widget = urwid.Text(option.name, urwid.LEFT, urwid.CLIP)
+        self.changed = option.modified
+        self.name = option.name
+        self.name_widget = urwid.Text('*' + self.name if self.changed else self.name, urwid.LEFT, urwid.CLIP)
         self.value_widget = self.build_value_widget(option)
         widget_list = [(urwid.WEIGHT, 40, self.name_widget), (urwid.WEIGHT, 60, self.value_widget)]
         super().__init__(widget_list, dividechars=1, focus_column=1)
 
-    # pylint: disable=inconsistent-return-statements
-    def build_value_widget(self, option: Option) -> MesonEdit:
+    def build_value_widget(self, option: Option) -> urwid.Widget:
         """
-        Build the corresponding :class:`MesonEdit` subclass depending in the option type.
+        Build the corresponding :class:`MesonEdit` or :class:`MesonIcon` subclass depending in the option type via
+        :obj:`_VALUE_WIDGET_BUILDERS`.
 
         Args:
             option: :class:`~.Option` to create the widget for.
         """
-        if option.type == MesonType.STRING:
-            return StringEdit(option.value)
-        if option.type == MesonType.BOOLEAN:
-            return BooleanEdit(option.value)
-        if option.type == MesonType.COMBO:
-            return ComboEdit(option.value, option.choices)
-        if option.type == MesonType.INTEGER:
-            return IntegerEdit(option.value)
-        if option.type == MesonType.ARRAY:
-            return ArrayEdit(option.value)
+        return _VALUE_WIDGET_BUILDERS[option.type](option)
 
     def set_changed(self) -> None:
         """
@@ -376,7 +426,7 @@ class OptionRow(urwid.Columns):
         if self.changed:
             return
         self.changed = True
-        self.name_widget.set_text('*' + self.name_widget.get_text()[0])
+        self.name_widget.set_text('*' + self.name)
 
     def get_value(self):
         """
@@ -386,41 +436,119 @@ class OptionRow(urwid.Columns):
         return self.value_widget.get_value()
 
 
+class OptionListWalker(urwid.ListWalker):
+    """
+    :class:`urwid.ListWalker` for the :class:`OptionList` that creates an :class:`OptionRow` for an :class:`~.Option`
+    only when the row is requested for the first time, i.e. when it is displayed. Created rows are cached, at most
+    :attr:`max_cached_rows` of them. The least recently used rows are dropped first, except the focused row. Since
+    changes are stored in the :class:`~.Option` right away, a dropped row is simply recreated from its option.
+
+    Args:
+        options: :obj:`list` of :class:`~.Option` to create the rows for.
+        changed_callback: Callback that is connected to the ``changed`` signal of every created :class:`OptionRow`'s
+                          value widget, with the widget and index as arguments.
+
+    Attributes:
+        focus: :obj:`int` index of the currently focused option.
+        options: :obj:`list` of :class:`~.Option` to create the rows for.
+        option_rows: :class:`collections.OrderedDict` mapping the option index to the cached :class:`OptionRow`,
+                     ordered from least to most recently used.
+        changed_callback: Callback connected to the ``changed`` signal of the created rows.
+    """
+
+    max_cached_rows = 256
+    """Maximum number of :class:`OptionRow` widgets kept in :attr:`option_rows`."""
+
+    def __init__(self, options: list[Option], changed_callback):
+        self.focus = 0
+        self.options = options
+        self.option_rows = collections.OrderedDict[int, OptionRow]()
+        self.changed_callback = changed_callback
+
+    def __getitem__(self, position: int) -> OptionRow:
+        """
+        Returns the :class:`OptionRow` at the given position, creating it if needed.
+
+        Args:
+            position: index of the option in :attr:`options`.
+
+        Returns:
+            :class:`OptionRow` for the option.
+        """
+        option_row = self.option_rows.get(position)
+        if option_row is not None:
+            self.option_rows.move_to_end(position)
+            return option_row
+        if not 0 <= position < len(self.options):
+            raise IndexError(position)
+        option_row = OptionRow(self.options[position])
+        urwid.connect_signal(
+            option_row.value_widget, 'changed', self.changed_callback, user_args=[option_row, position])
+        self.option_rows[position] = option_row
+        while len(self.option_rows) > self.max_cached_rows:
+            oldest = next(iter(self.option_rows))
+            if oldest == self.focus:
+                self.option_rows.move_to_end(oldest)
+            else:
+                del self.option_rows[oldest]
+        return option_row
+
+    def set_focus(self, position: int) -> None:
+        """
+        Sets the focus and emits a ``modified`` signal.
+
+        Args:
+            position: index of the new focused option.
+        """
+        self.focus = position
+        self._modified()
+
+    def next_position(self, position: int) -> int:
+        """
+        Returns:
+            Position after :paramref:`~next_position.position`, raises :obj:`IndexError` at the end of the list.
+        """
+        if position >= len(self.options) - 1:
+            raise IndexError(position)
+        return position + 1
+
+    def prev_position(self, position: int) -> int:
+        """
+        Returns:
+            Position before :paramref:`~prev_position.position`, raises :obj:`IndexError` at the start of the list.
+        """
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+
+    def positions(self, reverse: bool = False) -> range:
+        """
+        Returns:
+            :obj:`range` over all positions, reversed if :paramref:`~positions.reverse` is :obj:`True`.
+        """
+        if reverse:
+            return range(len(self.options) - 1, -1, -1)
+        return range(len(self.options))
+
+
 class OptionList(urwid.ListBox):
     """
     Body of the main frame. :class:`urwid.ListBox` containing a :class:`OptionRow` for every :class:`Option`.
 
     Attributes:
-        option_rows: :obj:`list` of :class:`OptionRow` contained in the widget.
-        walker: :class:`urwid.SimpleFocusListWalker` managing the focusing of the contained widgets.
+        options_manager: :class:`~.OptionsManager` containing the options, resolved once for the callbacks.
+        walker: :class:`OptionListWalker` creating the contained widgets and managing their focusing.
     """
 
     signals = ['focus-modified']
     """:obj:`list` of :mod:`urwid` signal names the class can emit."""
 
     def __init__(self):
-        self.option_rows = self.build_option_rows()
-        self.walker = urwid.SimpleFocusListWalker(self.option_rows)
+        self.options_manager = OptionsManager()
+        self.walker = OptionListWalker(self.options_manager.get_options(), self.entry_modified_callback)
         super().__init__(self.walker)
         urwid.connect_signal(self.walker, 'modified', self.focus_modified_callback)
 
-    def build_option_rows(self) -> list[OptionRow]:
-        """
-        Creates an :class:`OptionRow` for every :class:`~.Option` from the :class:`~.OptionsManager` and connects their
-        ``changed`` signal to :func:`entry_modified_callback()` with the widget and index as arguments.
-
-        Returns:
-            :obj:`list` of :class:`OptionRow`.
-        """
-        option_manager = OptionsManager()
-        option_rows = list[OptionRow]()
-        for index, option in enumerate(option_manager.get_options()):
-            option_row = OptionRow(option)
-            option_rows.append(option_row)
-            urwid.connect_signal(
-                option_row.value_widget, 'changed', self.entry_modified_callback, user_args=[option_row, index])
-        return option_rows
-
     def focus_modified_callback(self) -> None:
         """
         Callback for the ``modified`` signal from :attr:`walker`. Forwards the signal as ``focus-modified`` signal with
@@ -432,11 +560,10 @@ class OptionList(urwid.ListBox):
     def entry_modified_callback(self, option_row: OptionRow, option_index: int) -> None:
         """
         Callback for the ``changed`` signal from an :class:`OptionRow`. Sets the :class:`~.Option` as modified in the
-        :class:`~.OptionsManager` with the new value via :func:`MesonEdit.get_value()`.
+        :class:`~.OptionsManager` with the new value via :func:`OptionRow.get_value()`.
         """
         option_row.set_changed()
-        option_manager = OptionsManager()
-        option_manager.set_modified(option_index, option_row.get_value())
+        self.options_manager.set_modified(option_index, option_row.get_value())
 
 
 class Header(urwid.Text):
@@ -463,31 +590,52 @@ class Footer(urwid.Pile):
 
     Attributes:
         text_info: :class:`urwid.Text` containing the option meta info (see :func:`option_list_callback()`).
+        info_cache: :obj:`dict` mapping the option index to the already built info text.
+        option_index: :obj:`int` index of the option currently shown, :obj:`None` if no option is shown yet.
+        options_manager: :class:`~.OptionsManager` containing the options, resolved once for the callback.
     """
     def __init__(self):
+        self.options_manager = OptionsManager()
+        self.option_index = None
         divider = urwid.Divider()
         self.text_info = urwid.Text('\n\n', wrap=urwid.CLIP)
+        self.info_cache = dict[int, str]()
         text_help_str = 'Keys: [enter] Edit entry [c] Reconfigure [g] Configure [q] Quit'
         text_help = urwid.Text(text_help_str, wrap=urwid.CLIP)
         super().__init__([divider, self.text_info, text_help])
 
-    def option_list_callback(self, option_index: int) -> None:
+    def build_info_text(self, option: Option) -> str:
         """
-        Callback changing the option meta information in the footer.
+        Builds the three line info text for an option.
 
         Args:
-            option_index: index of the option for the :class:`~.OptionsManager`.
+            option: :class:`~.Option` to build the info text for.
+
+        Returns:
+            Info text as :obj:`str`.
         """
-        options_manager = OptionsManager()
-        option = options_manager.get_option(option_index)
-        choices_str = ''
-        if option.choices is not None:
-            choices_str = 'Choices:'
-            for choice in option.choices:
-                choices_str += f' {choice}'
+        choices_str = '' if option.choices is None else ' '.join(['Choices:', *option.choices])
         text_l1 = f'{option.name}: {option.description}'
         text_l2 = f'Section: {option.section.value}, Machine: {option.machine.value}, Type: {option.type.value}'
-        self.text_info.set_text(f'{text_l1}\n{text_l2}\n{choices_str}')
+        return f'{text_l1}\n{text_l2}\n{choices_str}'
+
+    def option_list_callback(self, option_index: int) -> None:
+        """
+        Callback changing the option meta information in the footer. The text for every option is only built once
+        via :func:`build_info_text()` and is only replaced if the shown option changed, since every
+        :func:`urwid.Text.set_text()` call invalidates the footer's canvas.
+
+        Args:
+            option_index: index of the option for the :class:`~.OptionsManager`.
+        """
+        if option_index == self.option_index:
+            return
+        self.option_index = option_index
+        text = self.info_cache.get(option_index)
+        if text is None:
+            text = self.build_info_text(self.options_manager.get_option(option_index))
+            self.info_cache[option_index] = text
+        self.text_info.set_text(text)
 
 
 def build_ui(project_name: str, project_version: str, meson_version: str) -> urwid.Widget:
@@ -506,48 +654,55 @@ def build_ui(project_name: str, project_version: str, meson_version: str) -> urw
     footer = Footer()
     body = OptionList()
     urwid.connect_signal(body, 'focus-modified', footer.option_list_callback)
-    body.focus_modified_callback()  # initial setting for footer
+    footer.option_list_callback(0)  # initial setting for footer, the first option has the focus
     frame = urwid.Frame(body, header, footer)
     return frame
 
 
-def global_key_handler(key: str) -> None:
+EXIT_KEYS = {
+    'q': ExitAction.NOTHING,
+    'Q': ExitAction.NOTHING,
+    'c': ExitAction.RECONFIGURE,
+    'C': ExitAction.RECONFIGURE,
+    'g': ExitAction.ONLY_CONFIGURE,
+    'G': ExitAction.ONLY_CONFIGURE,
+}
+""":obj:`dict` mapping the keys that exit the TUI to the corresponding :class:`~.ExitAction`."""
+
+
+def global_key_handler(meson_manager: MesonManager, key: str) -> None:
     """
-    Global key handler for unhandled key presses.
+    Global key handler for unhandled key presses. Exits the main loop for keys in :obj:`EXIT_KEYS`.
 
     Args:
+        meson_manager: :class:`~.MesonManager` to set the :class:`~.ExitAction` for.
         key: key name (given from :mod:`urwid`).
     """
-    meson_manager = MesonManager()
-    if key in ('q', 'Q'):
-        meson_manager.set_exit_action(ExitAction.NOTHING)
-        raise urwid.ExitMainLoop()
-    if key in ('c', 'C'):
-        meson_manager.set_exit_action(ExitAction.RECONFIGURE)
-        raise urwid.ExitMainLoop()
-    if key in ('g', 'G'):
-        meson_manager.set_exit_action(ExitAction.ONLY_CONFIGURE)
+    exit_action = EXIT_KEYS.get(key)
+    if exit_action is not None:
+        meson_manager.set_exit_action(exit_action)
         raise urwid.ExitMainLoop()
 
 
-def main_loop(top_level_widget: urwid.Widget) -> int:
+def main_loop(top_level_widget: urwid.Widget, meson_manager: MesonManager) -> int:
     """
     Creates and runs the :class:`urwid.MainLoop` object. After the loop exists, it run the :class:`~.ExitAction` from
     the :class:`~.MesonManager`.
 
     Args:
         top_level_widget: top-level urwid widget for the :class:`urwid.MainLoop` object.
+        meson_manager: :class:`~.MesonManager` used for the :class:`~.ExitAction`.
 
     Returns:
         Exit code from :attr:`~.MesonManager.run_exit_action()`.
     """
-    loop = urwid.MainLoop(top_level_widget, palette=PALETTE, unhandled_input=global_key_handler, handle_mouse=False)
+    unhandled_input = functools.partial(global_key_handler, meson_manager)
+    loop = urwid.MainLoop(top_level_widget, palette=PALETTE, unhandled_input=unhandled_input, handle_mouse=False)
     try:
         loop.run()
     except KeyboardInterrupt:
         urwid.ExitMainLoop()
 
-    meson_manager = MesonManager()
-    return_code = meson_manager.run_exit_action()
+    return_code = meson_manager.run_exit_action(OptionsManager())
 
     return return_code